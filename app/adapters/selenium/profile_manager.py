@@ -0,0 +1,217 @@
+# app/adapters/selenium/profile_manager.py
+"""
+Gestor de perfiles de Chrome por cuenta.
+
+Mantiene un user-data-dir plantilla ya inicializado por Chrome y lo clona de forma
+económica para cada cuenta, de modo que el navegador no tenga que crear sus bases de
+datos en cada arranque y el estado de cada cuenta se reutilice entre sesiones.
+"""
+
+import errno
+import hashlib
+import os
+import shutil
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Set, Tuple
+from app.shared.logger import logger
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - plataformas sin fcntl (Windows)
+    fcntl = None
+
+# ioctl de Linux para clonar un fichero mediante reflink (copy-on-write)
+_FICLONE = 0x40049409
+
+# Ficheros de bloqueo que Chrome deja en el user-data-dir y que no deben clonarse
+_LOCK_FILES = {"SingletonLock", "SingletonSocket", "SingletonCookie", "lockfile"}
+
+_READY_MARKER = ".template_ready"
+_LAST_USED_MARKER = ".last_used"
+
+# Excepción personalizada para errores relacionados con perfiles
+class ProfileError(Exception):
+    """Excepción lanzada cuando falla la preparación o el uso de un perfil de Chrome."""
+    pass
+
+def _clone_file(src: str, dst: str) -> str:
+    """
+    Copia un fichero usando reflink si el sistema de ficheros lo soporta.
+
+    Los hardlinks no se usan: Chrome reescribe sus bases de datos SQLite en el sitio,
+    por lo que un enlace duro propagaría los cambios de una cuenta a la plantilla.
+
+    Args:
+        src (str): Ruta del fichero de origen.
+        dst (str): Ruta del fichero de destino.
+
+    Returns:
+        str: Ruta del fichero de destino.
+    """
+    if fcntl is not None:
+        try:
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+            shutil.copystat(src, dst)
+            return dst
+        except OSError as e:
+            if e.errno not in (errno.EOPNOTSUPP, errno.ENOTTY, errno.EXDEV, errno.EINVAL, errno.ENOSYS):
+                raise
+    return shutil.copy2(src, dst)
+
+class ProfileManager:
+    """
+    Gestiona la plantilla de perfil de Chrome y sus clones por cuenta.
+
+    Attributes:
+        root (Path): Directorio raíz donde se guardan la plantilla y los perfiles.
+        ttl_seconds (float): Segundos sin uso tras los cuales un perfil se considera obsoleto.
+    """
+    def __init__(self, root: str, ttl_hours: int, bootstrap: Callable[[Path], None]):
+        """
+        Args:
+            root (str): Directorio raíz de los perfiles.
+            ttl_hours (int): Horas sin uso tras las cuales un perfil se elimina.
+            bootstrap (Callable[[Path], None]): Función que arranca Chrome una vez sobre
+                el directorio indicado para que cree sus bases de datos.
+        """
+        self.root = Path(root)
+        self.ttl_seconds = ttl_hours * 3600
+        self._bootstrap = bootstrap
+        self._template_dir = self.root / "template"
+        self._accounts_dir = self.root / "accounts"
+        self._in_use: Set[Tuple[str, str]] = set()
+        self._lock = threading.Lock()  # Protege _in_use y el borrado de perfiles
+        self._template_lock = threading.Lock()  # Serializa la creación de la plantilla
+
+    def _profile_dir(self, account: Tuple[str, str]) -> Path:
+        """Devuelve el directorio del perfil de una cuenta sin exponer su nombre en disco."""
+        site, username = account
+        digest = hashlib.sha256(f"{site}\0{username}".encode("utf-8")).hexdigest()[:32]
+        return self._accounts_dir / digest
+
+    def ensure_template(self) -> Path:
+        """
+        Crea la plantilla de perfil si todavía no existe.
+
+        Returns:
+            Path: Directorio de la plantilla.
+
+        Raises:
+            ProfileError: Si Chrome no consigue inicializar la plantilla.
+        """
+        if (self._template_dir / _READY_MARKER).exists():
+            return self._template_dir
+        with self._template_lock:
+            # Otro hilo puede haberla creado mientras se esperaba el lock
+            if (self._template_dir / _READY_MARKER).exists():
+                return self._template_dir
+            staging = None
+            try:
+                self.root.mkdir(parents=True, exist_ok=True)
+                staging = Path(tempfile.mkdtemp(prefix="template.tmp-", dir=self.root))
+                self._bootstrap(staging)
+                for name in _LOCK_FILES:
+                    path = staging / name
+                    if path.is_symlink() or path.exists():
+                        path.unlink()
+                (staging / _READY_MARKER).touch()
+                shutil.rmtree(self._template_dir, ignore_errors=True)
+                os.replace(staging, self._template_dir)
+                logger.info(f"Plantilla de perfil creada en {self._template_dir}")
+                return self._template_dir
+            except Exception as e:
+                if staging is not None:
+                    shutil.rmtree(staging, ignore_errors=True)
+                logger.error(f"Error al crear la plantilla de perfil: {e}")
+                raise ProfileError(f"Error al crear la plantilla de perfil: {e}") from e
+
+    def acquire(self, account: Tuple[str, str]) -> Path:
+        """
+        Reserva el perfil de una cuenta, clonándolo desde la plantilla si no existe.
+
+        Args:
+            account (Tuple[str, str]): Cuenta como (sitio, usuario).
+
+        Returns:
+            Path: Directorio del perfil a usar como user-data-dir.
+
+        Raises:
+            ProfileError: Si el perfil ya está en uso o no se puede preparar.
+        """
+        with self._lock:
+            if account in self._in_use:
+                raise ProfileError("El perfil de la cuenta ya está en uso por otra sesión.")
+            self._in_use.add(account)
+        profile_dir = self._profile_dir(account)
+        staging = None
+        try:
+            if not profile_dir.exists():
+                template = self.ensure_template()
+                self._accounts_dir.mkdir(parents=True, exist_ok=True)
+                staging = Path(tempfile.mkdtemp(prefix=f"{profile_dir.name}.tmp-", dir=self._accounts_dir))
+                shutil.copytree(
+                    template,
+                    staging,
+                    symlinks=True,
+                    ignore=shutil.ignore_patterns(_READY_MARKER, *_LOCK_FILES),
+                    copy_function=_clone_file,
+                    dirs_exist_ok=True,
+                )
+                os.replace(staging, profile_dir)
+                logger.info(f"Perfil clonado desde la plantilla: {profile_dir.name}")
+            (profile_dir / _LAST_USED_MARKER).touch()
+            return profile_dir
+        except Exception as e:
+            if staging is not None:
+                shutil.rmtree(staging, ignore_errors=True)
+            with self._lock:
+                self._in_use.discard(account)
+            logger.error(f"Error al preparar el perfil de la cuenta: {e}")
+            raise ProfileError(f"Error al preparar el perfil: {e}") from e
+
+    def release(self, account: Tuple[str, str]) -> None:
+        """
+        Libera el perfil de una cuenta al cerrar su sesión.
+
+        Args:
+            account (Tuple[str, str]): Cuenta como (sitio, usuario).
+        """
+        with self._lock:
+            self._in_use.discard(account)
+        marker = self._profile_dir(account) / _LAST_USED_MARKER
+        if marker.parent.exists():
+            marker.touch()
+
+    def collect_garbage(self) -> int:
+        """
+        Elimina los perfiles que no se han usado durante más de ttl_seconds.
+
+        Returns:
+            int: Número de perfiles eliminados.
+        """
+        if not self._accounts_dir.exists():
+            return 0
+        now = time.time()
+        removed = 0
+        for profile_dir in self._accounts_dir.iterdir():
+            # La comprobación y el borrado se hacen bajo el lock para que un acquire()
+            # concurrente no reciba un perfil que se está eliminando
+            with self._lock:
+                in_use = {self._profile_dir(account).name for account in self._in_use}
+                if profile_dir.name.split(".", 1)[0] in in_use:
+                    continue
+                marker = profile_dir / _LAST_USED_MARKER
+                try:
+                    last_used = marker.stat().st_mtime if marker.exists() else profile_dir.stat().st_mtime
+                except OSError:
+                    continue
+                if now - last_used > self.ttl_seconds:
+                    shutil.rmtree(profile_dir, ignore_errors=True)
+                    removed += 1
+        if removed:
+            logger.info(f"Perfiles obsoletos eliminados: {removed}")
+        return removed
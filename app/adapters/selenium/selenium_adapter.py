@@ -7,15 +7,17 @@ Implementa el puerto de salida SeleniumPort para gestionar sesiones de navegador
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
+from app.adapters.selenium.profile_manager import ProfileManager
+from app.adapters.selenium.wait_strategy import AdaptiveWaiter
 from app.domain.entities.session import Session
 from app.ports.out.selenium_port import SeleniumPort
 from app.config.config import config
 from app.shared.logger import logger
 import uuid
 from datetime import datetime, timedelta
+from pathlib import Path
 from typing import Dict, Optional
+from urllib.parse import urlparse
 
 class SeleniumAdapter(SeleniumPort):
     """
@@ -23,29 +25,65 @@ class SeleniumAdapter(SeleniumPort):
     """
     def __init__(self):
         self.sessions = {}  # Almacenamiento temporal de sesiones
+        self.session_accounts = {}  # Cuenta asociada a cada sesión, para liberar su perfil
+        self.profiles = ProfileManager(
+            config.SELENIUM_PROFILES_DIR,
+            config.SELENIUM_PROFILE_TTL_HOURS,
+            self._bootstrap_profile,
+        )
+        self.profiles.collect_garbage()
+        self.waiter = AdaptiveWaiter(
+            default_timeout=config.SELENIUM_WAIT_DEFAULT_TIMEOUT,
+            max_timeout=config.SELENIUM_WAIT_MAX_TIMEOUT,
+        )
 
-    def _init_driver(self) -> webdriver.Chrome:
+    def _init_driver(self, profile_dir: Optional[Path] = None) -> webdriver.Chrome:
         """
         Inicializa un nuevo driver de Chrome con las opciones configuradas.
+
+        Args:
+            profile_dir (Optional[Path]): user-data-dir a reutilizar; si es None Chrome
+                arranca con un perfil vacío.
         """
         options = Options()
         if config.SELENIUM_HEADLESS:
             options.add_argument("--headless")
         options.add_argument("--no-sandbox")
         options.add_argument("--disable-dev-shm-usage")
+        if profile_dir is not None:
+            options.add_argument(f"--user-data-dir={profile_dir.resolve()}")
         return webdriver.Chrome(options=options)
 
+    def _bootstrap_profile(self, profile_dir: Path) -> None:
+        """
+        Arranca Chrome una vez sobre profile_dir para que cree sus bases de datos.
+        """
+        driver = self._init_driver(profile_dir)
+        try:
+            driver.get("about:blank")
+        finally:
+            driver.quit()
+
     def create_session(self, url: str, credentials: Dict[str, str]) -> Session:
         """
-        Crea una nueva sesión de navegador y realiza el login.
+        Crea una nueva sesión de navegador y realiza el login si el perfil no conserva la sesión.
         """
+        site = urlparse(url).netloc
+        account = (site, credentials["username"])
+        profile_dir = self.profiles.acquire(account)
+        driver = None
         try:
-            driver = self._init_driver()
+            driver = self._init_driver(profile_dir)
             driver.get(url)
-            WebDriverWait(driver, 10).until(EC.presence_of_element_located((By.NAME, "username"))).send_keys(credentials["username"])
-            driver.find_element(By.NAME, "password").send_keys(credentials["password"])
-            driver.find_element(By.NAME, "login").click()
-            WebDriverWait(driver, 10).until(EC.presence_of_element_located((By.ID, "dashboard")))
+            # Con un perfil que conserva la sesión el sitio puede llevar directamente al dashboard
+            landing = self.waiter.wait_for(driver, site, (By.CSS_SELECTOR, '[id="dashboard"], [name="username"]'))
+            if landing.get_attribute("name") == "username":
+                landing.send_keys(credentials["username"])
+                driver.find_element(By.NAME, "password").send_keys(credentials["password"])
+                driver.find_element(By.NAME, "login").click()
+                self.waiter.wait_for(driver, site, (By.ID, "dashboard"))
+            else:
+                logger.info(f"Login omitido, el perfil conserva la sesión en {site}")
             cookies = {cookie["name"]: cookie["value"] for cookie in driver.get_cookies()}
             session_id = str(uuid.uuid4())
             session = Session(
@@ -55,9 +93,13 @@ class SeleniumAdapter(SeleniumPort):
                 expires_at=datetime.utcnow() + timedelta(hours=24)
             )
             self.sessions[session_id] = driver
+            self.session_accounts[session_id] = account
             logger.info(f"Sesión creada: {session_id}")
             return session
         except Exception as e:
+            if driver is not None:
+                driver.quit()
+            self.profiles.release(account)
             logger.error(f"Error al crear sesión con Selenium: {e}")
             raise
 
@@ -81,4 +123,8 @@ class SeleniumAdapter(SeleniumPort):
         if session_id in self.sessions:
             self.sessions[session_id].quit()
             del self.sessions[session_id]
-            logger.info(f"Sesión cerrada: {session_id}")
\ No newline at end of file
+            account = self.session_accounts.pop(session_id, None)
+            if account is not None:
+                self.profiles.release(account)
+            logger.info(f"Sesión cerrada: {session_id}")
+            self.profiles.collect_garbage()
\ No newline at end of file
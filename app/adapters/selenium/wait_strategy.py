@@ -0,0 +1,205 @@
+# app/adapters/selenium/wait_strategy.py
+"""
+Esperas basadas en eventos con timeouts adaptativos para Selenium.
+
+En lugar de sondear el DOM con WebDriverWait, instala un MutationObserver en la página
+que responde en cuanto el elemento aparece. El presupuesto de espera de cada sitio se
+calcula a partir de un histórico móvil de latencias (p99 más un margen).
+"""
+
+import math
+import time
+from collections import deque
+from typing import Deque, Dict, Optional, Tuple
+from selenium.common.exceptions import (
+    InvalidSelectorException,
+    JavascriptException,
+    StaleElementReferenceException,
+    TimeoutException,
+    WebDriverException,
+)
+from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.remote.webelement import WebElement
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+from app.shared.logger import logger
+
+# Pausa entre reintentos cuando una navegación aborta el script de espera
+_NAVIGATION_RETRY_DELAY = 0.05
+
+# Fragmentos (en minúsculas) con los que los drivers informan de que una navegación
+# descargó el documento mientras el script esperaba
+_NAVIGATION_MARKERS = ("document unloaded", "document was unloaded", "navigation")
+
+# Script asíncrono: resuelve con el elemento en cuanto existe, o con null al agotar el tiempo
+_WAIT_FOR_ELEMENT_JS = """
+var selector = arguments[0];
+var timeoutMs = arguments[1];
+var done = arguments[arguments.length - 1];
+var found = document.querySelector(selector);
+if (found) { done(found); return; }
+var timer = null;
+var observer = new MutationObserver(function () {
+    var el = document.querySelector(selector);
+    if (el) { observer.disconnect(); clearTimeout(timer); done(el); }
+});
+observer.observe(document.documentElement || document, {childList: true, subtree: true, attributes: true});
+timer = setTimeout(function () { observer.disconnect(); done(null); }, timeoutMs);
+"""
+
+def _css_string(value: str) -> str:
+    """
+    Serializa un valor como cadena CSS entre comillas (CSSOM, "serialize a string").
+
+    Los caracteres de control se escriben como escapes hexadecimales seguidos de un
+    espacio; las comillas y la barra invertida se escapan con barra invertida.
+    """
+    escaped = []
+    for char in value:
+        if char == "\0":
+            escaped.append("\ufffd")
+        elif "\x01" <= char <= "\x1f" or char == "\x7f":
+            escaped.append(f"\\{ord(char):x} ")
+        elif char in ('"', "\\"):
+            escaped.append(f"\\{char}")
+        else:
+            escaped.append(char)
+    return '"' + "".join(escaped) + '"'
+
+def _css_selector(locator: Tuple[str, str]) -> Optional[str]:
+    """
+    Traduce un localizador de Selenium a selector CSS si es posible.
+
+    Returns:
+        Optional[str]: Selector CSS, o None si el localizador no tiene equivalente.
+    """
+    by, value = locator
+    if by == By.CSS_SELECTOR:
+        return value
+    if by == By.ID:
+        return f"[id={_css_string(value)}]"
+    if by == By.NAME:
+        return f"[name={_css_string(value)}]"
+    return None
+
+class AdaptiveWaiter:
+    """
+    Espera elementos mediante eventos del DOM con un presupuesto aprendido por sitio.
+
+    Attributes:
+        default_timeout (float): Presupuesto en segundos mientras no hay histórico suficiente.
+        max_timeout (float): Presupuesto máximo en segundos.
+        margin (float): Factor aplicado al p99 observado.
+        history (Dict[str, Deque[float]]): Latencias recientes por sitio, en segundos.
+    """
+    def __init__(
+        self,
+        default_timeout: float = 10.0,
+        max_timeout: float = 60.0,
+        margin: float = 1.5,
+        window: int = 100,
+        min_samples: int = 20,
+    ):
+        self.default_timeout = default_timeout
+        self.max_timeout = max_timeout
+        self.margin = margin
+        self.window = window
+        self.min_samples = min_samples
+        self.history: Dict[str, Deque[float]] = {}
+
+    def budget(self, site: str) -> float:
+        """
+        Calcula el presupuesto de espera de un sitio a partir de su histórico.
+
+        Args:
+            site (str): Sitio (host) al que pertenece la espera.
+
+        Returns:
+            float: Timeout en segundos.
+        """
+        samples = self.history.get(site)
+        if not samples or len(samples) < self.min_samples:
+            return self.default_timeout
+        ordered = sorted(samples)
+        p99 = ordered[max(0, math.ceil(0.99 * len(ordered)) - 1)]
+        return min(self.max_timeout, max(1.0, p99 * self.margin))
+
+    def _record(self, site: str, element: str, elapsed: float, outcome: str) -> None:
+        """Guarda la latencia en el histórico del sitio y la publica como métrica."""
+        self.history.setdefault(site, deque(maxlen=self.window)).append(elapsed)
+        logger.info(
+            f"metric=selenium_wait_seconds site={site} element={element} "
+            f"outcome={outcome} value={elapsed:.3f}"
+        )
+
+    def wait_for(self, driver: WebDriver, site: str, locator: Tuple[str, str]) -> WebElement:
+        """
+        Espera a que un elemento esté presente en la página.
+
+        Args:
+            driver (WebDriver): Driver sobre el que esperar.
+            site (str): Sitio al que se imputa la latencia.
+            locator (Tuple[str, str]): Localizador de Selenium del elemento.
+
+        Returns:
+            WebElement: Elemento encontrado.
+
+        Raises:
+            TimeoutException: Si el elemento no aparece dentro del presupuesto.
+            WebDriverException: Si el driver falla por otro motivo (no se registra latencia).
+        """
+        timeout = self.budget(site)
+        element = f"{locator[0]}={locator[1]}"
+        start = time.monotonic()
+        try:
+            found = self._wait_event(driver, locator, timeout, start)
+        except TimeoutException:
+            # Una espera agotada cuenta como latencia para que el presupuesto crezca
+            self._record(site, element, time.monotonic() - start, "timeout")
+            raise
+        self._record(site, element, time.monotonic() - start, "ok")
+        return found
+
+    def _wait_event(self, driver: WebDriver, locator: Tuple[str, str], timeout: float, start: float) -> WebElement:
+        """
+        Espera el elemento con un MutationObserver, reintentando si la página navega.
+
+        Si el localizador no tiene equivalente CSS se recurre a WebDriverWait.
+        """
+        selector = _css_selector(locator)
+        if selector is None:
+            return WebDriverWait(driver, timeout).until(EC.presence_of_element_located(locator))
+        # set_script_timeout es global al driver; se restaura al terminar la espera
+        previous_timeout = driver.timeouts.script
+        try:
+            while True:
+                remaining = timeout - (time.monotonic() - start)
+                if remaining <= 0:
+                    raise TimeoutException(f"Elemento no encontrado: {locator}")
+                driver.set_script_timeout(remaining + 1)
+                try:
+                    found = driver.execute_async_script(_WAIT_FOR_ELEMENT_JS, selector, int(remaining * 1000))
+                except TimeoutException:
+                    raise TimeoutException(f"Elemento no encontrado: {locator}")
+                except StaleElementReferenceException as e:
+                    logger.debug(f"Espera interrumpida por navegación, reintentando: {e}")
+                except JavascriptException as e:
+                    message = (e.msg or "").lower()
+                    if "not a valid selector" in message or "syntaxerror" in message:
+                        raise InvalidSelectorException(f"Selector no válido: {selector}") from e
+                    if not any(marker in message for marker in _NAVIGATION_MARKERS):
+                        raise
+                    # La navegación descarga el documento y aborta el script; se vuelve a instalar
+                    logger.debug(f"Espera interrumpida por navegación, reintentando: {e}")
+                else:
+                    if found is None:
+                        raise TimeoutException(f"Elemento no encontrado: {locator}")
+                    return found
+                time.sleep(min(_NAVIGATION_RETRY_DELAY, max(0.0, timeout - (time.monotonic() - start))))
+        finally:
+            try:
+                driver.set_script_timeout(previous_timeout)
+            except WebDriverException as e:
+                # Con el driver caído no se puede restaurar; se conserva el error original
+                logger.debug(f"No se pudo restaurar el timeout de scripts: {e}")
@@ -1,10 +1,13 @@
 # app/adapters/storage/storage_adapter.py
 """
 Adaptador para almacenamiento persistente.
-Implementa el puerto de salida StoragePort para guardar y recuperar sesiones.
+Implementa el puerto de salida StoragePort para guardar y recuperar sesiones y publicaciones programadas.
 """
 
-from typing import Optional
+import bisect
+from datetime import datetime
+from typing import Dict, List, Optional
+from app.domain.entities.scheduled_post import ScheduledPost
 from app.domain.entities.session import Session
 from app.ports.out.storage_port import StoragePort
 from app.shared.logger import logger
@@ -13,8 +16,15 @@ class InMemoryStorageAdapter(StoragePort):
     """
     Adaptador de almacenamiento en memoria para sesiones.
     """
+    # Tamaño en segundos de los tramos en que se indexan las publicaciones programadas
+    SCHEDULE_BUCKET_SECONDS = 3600
+    _EPOCH = datetime(1970, 1, 1)
+
     def __init__(self):
         self.sessions = {}
+        self.scheduled_posts: Dict[int, Dict[str, ScheduledPost]] = {}  # Tramo -> publicaciones
+        self.scheduled_buckets: List[int] = []  # Tramos no vacíos, ordenados
+        self.scheduled_index: Dict[str, int] = {}  # post_id -> tramo
 
     def save_session(self, session: Session) -> None:
         """
@@ -35,4 +45,48 @@ class InMemoryStorageAdapter(StoragePort):
         """
         if session_id in self.sessions:
             del self.sessions[session_id]
-            logger.info(f"Sesión eliminada de memoria: {session_id}")
\ No newline at end of file
+            logger.info(f"Sesión eliminada de memoria: {session_id}")
+
+    def _schedule_bucket(self, when: datetime) -> int:
+        """Devuelve el tramo horario al que pertenece una fecha."""
+        return int((when - self._EPOCH).total_seconds()) // self.SCHEDULE_BUCKET_SECONDS
+
+    def save_scheduled_post(self, post: ScheduledPost) -> None:
+        """
+        Guarda una publicación programada en su tramo horario.
+        """
+        self.delete_scheduled_posts([post.post_id])
+        bucket = self._schedule_bucket(post.due_at)
+        if bucket not in self.scheduled_posts:
+            self.scheduled_posts[bucket] = {}
+            bisect.insort(self.scheduled_buckets, bucket)
+        self.scheduled_posts[bucket][post.post_id] = post
+        self.scheduled_index[post.post_id] = bucket
+        logger.debug(f"Publicación programada guardada en memoria: {post.post_id}")
+
+    def load_scheduled_posts(self, start: Optional[datetime], end: datetime) -> List[ScheduledPost]:
+        """
+        Carga las publicaciones del intervalo [start, end) recorriendo solo sus tramos.
+        """
+        first = 0 if start is None else bisect.bisect_left(self.scheduled_buckets, self._schedule_bucket(start))
+        last = bisect.bisect_right(self.scheduled_buckets, self._schedule_bucket(end))
+        posts = []
+        for bucket in self.scheduled_buckets[first:last]:
+            for post in self.scheduled_posts[bucket].values():
+                if (start is None or post.due_at >= start) and post.due_at < end:
+                    posts.append(post)
+        return posts
+
+    def delete_scheduled_posts(self, post_ids: List[str]) -> None:
+        """
+        Elimina un lote de publicaciones programadas.
+        """
+        for post_id in post_ids:
+            bucket = self.scheduled_index.pop(post_id, None)
+            if bucket is None:
+                continue
+            posts = self.scheduled_posts[bucket]
+            del posts[post_id]
+            if not posts:
+                del self.scheduled_posts[bucket]
+                del self.scheduled_buckets[bisect.bisect_left(self.scheduled_buckets, bucket)]
\ No newline at end of file
@@ -26,6 +26,10 @@ class Config(BaseSettings):
         TELEGRAM_BOT_TOKEN (str): Token del bot de Telegram.
         TELEGRAM_ADMIN_IDS (str): Lista de IDs de administradores separados por comas.
         SELENIUM_HEADLESS (bool): Bandera para ejecutar Selenium en modo headless.
+        SELENIUM_PROFILES_DIR (str): Directorio raíz de los perfiles de Chrome (plantilla y cuentas).
+        SELENIUM_PROFILE_TTL_HOURS (int): Horas sin uso tras las cuales un perfil de cuenta se elimina.
+        SELENIUM_WAIT_DEFAULT_TIMEOUT (float): Timeout inicial de las esperas mientras no hay histórico.
+        SELENIUM_WAIT_MAX_TIMEOUT (float): Timeout máximo que pueden alcanzar las esperas adaptativas.
 
     Raises:
         ConfigError: Si las variables de entorno no son válidas o están ausentes.
@@ -33,6 +37,10 @@ class Config(BaseSettings):
     TELEGRAM_BOT_TOKEN: str = Field(..., env="TELEGRAM_BOT_TOKEN")
     TELEGRAM_ADMIN_IDS: str = Field(..., env="TELEGRAM_ADMIN_IDS")
     SELENIUM_HEADLESS: bool = Field(True, env="SELENIUM_HEADLESS")
+    SELENIUM_PROFILES_DIR: str = Field(".profiles", env="SELENIUM_PROFILES_DIR")
+    SELENIUM_PROFILE_TTL_HOURS: int = Field(72, env="SELENIUM_PROFILE_TTL_HOURS")
+    SELENIUM_WAIT_DEFAULT_TIMEOUT: float = Field(10.0, env="SELENIUM_WAIT_DEFAULT_TIMEOUT")
+    SELENIUM_WAIT_MAX_TIMEOUT: float = Field(60.0, env="SELENIUM_WAIT_MAX_TIMEOUT")
 
     class Config:
         """Configuración de pydantic para la carga de variables de entorno."""
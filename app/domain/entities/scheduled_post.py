@@ -0,0 +1,38 @@
+# app/domain/entities/scheduled_post.py
+"""
+Entidad que representa una publicación programada para una fecha futura.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime
+
+# Excepción personalizada para errores relacionados con publicaciones programadas
+class ScheduledPostError(Exception):
+    """Excepción lanzada cuando falla la creación o programación de una publicación."""
+    pass
+
+@dataclass
+class ScheduledPost:
+    """
+    Entidad que representa una publicación programada.
+
+    Attributes:
+        post_id (str): Identificador único de la publicación.
+        account (str): Cuenta con la que se publicará.
+        content (str): Contenido de la publicación.
+        due_at (datetime): Fecha (UTC) en la que debe publicarse.
+    """
+    post_id: str
+    account: str
+    content: str
+    due_at: datetime
+
+    def __post_init__(self):
+        """Valida los atributos de la publicación tras su inicialización."""
+        try:
+            if not self.post_id:
+                raise ScheduledPostError("El post_id no puede estar vacío.")
+            if not self.account:
+                raise ScheduledPostError("La cuenta no puede estar vacía.")
+        except Exception as e:
+            raise ScheduledPostError(f"Error al inicializar la publicación: {e}") from e
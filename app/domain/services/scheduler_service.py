@@ -0,0 +1,261 @@
+# app/domain/services/scheduler_service.py
+"""
+Servicio de dominio para la programación de publicaciones.
+
+Este servicio mantiene en una rueda de tiempo jerárquica las publicaciones que vencen
+dentro de un horizonte cercano y deja el resto solo en el almacenamiento, que se va
+leyendo por tramos a medida que avanza el tiempo. Así la inserción y la cancelación son
+O(1) y, tras un reinicio, solo se recupera el horizonte cercano en vez de todo el histórico.
+"""
+
+import asyncio
+import threading
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Optional, Set
+from app.domain.entities.scheduled_post import ScheduledPost, ScheduledPostError
+from app.domain.services.timing_wheel import TimingWheel
+from app.ports.out.storage_port import StoragePort
+from app.shared.logger import logger
+
+_EPOCH = datetime(1970, 1, 1)
+
+def _to_tick(when: datetime) -> int:
+    """Convierte una fecha UTC en el tick (segundo) correspondiente de la rueda."""
+    return int((when - _EPOCH).total_seconds())
+
+class SchedulerService:
+    """
+    Servicio para programar publicaciones y entregarlas en lote cuando vencen.
+
+    Attributes:
+        storage (StoragePort): Almacenamiento persistente de las publicaciones.
+        dispatch (Callable[[List[ScheduledPost]], List[str]]): Receptor de los lotes vencidos
+            (la capa de sesiones); devuelve los IDs que ha entregado. Con run() se invoca
+            desde un hilo del executor, así que puede bloquear.
+        horizon (timedelta): Ventana futura que se mantiene cargada en la rueda.
+        load_step (timedelta): Tamaño de cada tramo leído del almacenamiento.
+        retry_delay (timedelta): Espera antes del primer reintento de una publicación no entregada.
+        max_retry_delay (timedelta): Espera máxima entre reintentos.
+    """
+    def __init__(
+        self,
+        storage: StoragePort,
+        dispatch: Callable[[List[ScheduledPost]], List[str]],
+        horizon: timedelta = timedelta(days=1),
+        load_step: timedelta = timedelta(hours=1),
+        retry_delay: timedelta = timedelta(seconds=30),
+        max_retry_delay: timedelta = timedelta(hours=1),
+    ):
+        self.storage = storage
+        self.dispatch = dispatch
+        self.horizon = horizon
+        self.load_step = load_step
+        self.retry_delay = retry_delay
+        self.max_retry_delay = max_retry_delay
+        self.attempts: Dict[str, int] = {}  # post_id -> entregas fallidas consecutivas
+        self.pending_deletes: Set[str] = set()  # Entregadas cuyo borrado del almacenamiento falló
+        self.in_flight: Dict[str, ScheduledPost] = {}  # Lote que se está entregando
+        # Protege la rueda y el almacenamiento cuando tick() corre en un hilo (ver run())
+        self._lock = threading.Lock()
+        self.wheel: Optional[TimingWheel[ScheduledPost]] = None
+        self.loaded_until: Optional[datetime] = None
+
+    def recover(self, now: Optional[datetime] = None) -> int:
+        """
+        Reconstruye la rueda desde el almacenamiento tras un arranque.
+
+        Solo se leen las publicaciones atrasadas y las que vencen dentro del horizonte.
+
+        Args:
+            now (Optional[datetime]): Fecha actual (UTC); por defecto datetime.utcnow().
+
+        Returns:
+            int: Número de publicaciones cargadas en la rueda.
+
+        Raises:
+            ScheduledPostError: Si falla la lectura del almacenamiento.
+        """
+        now = now or datetime.utcnow()
+        wheel = TimingWheel(_to_tick(now))
+        if max(self.horizon + self.load_step, self.max_retry_delay) > timedelta(seconds=wheel.capacity):
+            raise ScheduledPostError("El horizonte de carga supera la capacidad de la rueda.")
+        with self._lock:
+            try:
+                posts = self.storage.load_scheduled_posts(None, now + self.horizon)
+            except Exception as e:
+                logger.error(f"Error al recuperar publicaciones programadas: {e}")
+                raise ScheduledPostError(f"Error al recuperar publicaciones: {e}") from e
+            for post in posts:
+                wheel.add(post.post_id, _to_tick(post.due_at), post)
+            self.wheel = wheel
+            self.loaded_until = now + self.horizon
+        logger.info(f"Publicaciones programadas recuperadas: {len(posts)}")
+        return len(posts)
+
+    def schedule(self, post: ScheduledPost) -> None:
+        """
+        Programa una publicación, persistiéndola y añadiéndola a la rueda si vence pronto.
+
+        Args:
+            post (ScheduledPost): Publicación a programar.
+
+        Raises:
+            ScheduledPostError: Si el servicio no está iniciado o falla el almacenamiento.
+        """
+        if self.wheel is None:
+            raise ScheduledPostError("El planificador no está iniciado; llama a recover().")
+        with self._lock:
+            try:
+                self.storage.save_scheduled_post(post)
+            except Exception as e:
+                logger.error(f"Error al guardar la publicación programada: {e}")
+                raise ScheduledPostError(f"Error al guardar la publicación: {e}") from e
+            self.attempts.pop(post.post_id, None)
+            # Un ID reutilizado no debe verse afectado por la entrega anterior
+            self.pending_deletes.discard(post.post_id)
+            self.in_flight.pop(post.post_id, None)
+            if post.due_at < self.loaded_until:
+                self.wheel.add(post.post_id, _to_tick(post.due_at), post)
+            else:
+                # Una reprogramación hacia fuera del horizonte debe salir de la rueda
+                self.wheel.cancel(post.post_id)
+        logger.debug(f"Publicación programada: {post.post_id} para {post.due_at}")
+
+    def cancel(self, post_id: str) -> None:
+        """
+        Cancela una publicación programada.
+
+        Args:
+            post_id (str): ID de la publicación.
+
+        Raises:
+            ScheduledPostError: Si el servicio no está iniciado o falla el almacenamiento.
+        """
+        if self.wheel is None:
+            raise ScheduledPostError("El planificador no está iniciado; llama a recover().")
+        with self._lock:
+            self.wheel.cancel(post_id)
+            self.attempts.pop(post_id, None)
+            # Si está en un lote en curso, no se reintentará aunque la entrega falle
+            self.in_flight.pop(post_id, None)
+            try:
+                self.storage.delete_scheduled_posts([post_id])
+            except Exception as e:
+                logger.error(f"Error al cancelar la publicación programada: {e}")
+                raise ScheduledPostError(f"Error al cancelar la publicación: {e}") from e
+        logger.debug(f"Publicación cancelada: {post_id}")
+
+    def _extend_horizon(self, now: datetime) -> None:
+        """Carga en la rueda los tramos del almacenamiento que entran en el horizonte."""
+        while self.loaded_until < now + self.horizon:
+            end = self.loaded_until + self.load_step
+            for post in self.storage.load_scheduled_posts(self.loaded_until, end):
+                self.wheel.add(post.post_id, _to_tick(post.due_at), post)
+            self.loaded_until = end
+
+    def tick(self, now: Optional[datetime] = None) -> List[ScheduledPost]:
+        """
+        Avanza el planificador y entrega en un único lote las publicaciones vencidas.
+
+        Solo se eliminan del almacenamiento las publicaciones cuyo ID devuelve dispatch;
+        el resto vuelve a la rueda con una espera exponencial para reintentarse. Si el
+        borrado falla, los IDs entregados quedan pendientes y se reintenta su borrado en el
+        siguiente tick, sin volver a entregarlos.
+
+        Args:
+            now (Optional[datetime]): Fecha actual (UTC); por defecto datetime.utcnow().
+
+        Returns:
+            List[ScheduledPost]: Publicaciones entregadas.
+
+        Raises:
+            ScheduledPostError: Si el servicio no está iniciado o falla el almacenamiento.
+        """
+        if self.wheel is None:
+            raise ScheduledPostError("El planificador no está iniciado; llama a recover().")
+        now = now or datetime.utcnow()
+        with self._lock:
+            self._flush_pending_deletes()
+            # Se avanza antes de ampliar el horizonte para que lo cargado quepa en la rueda;
+            # lo que ya estuviera vencido en los nuevos tramos sale en el segundo avance
+            due = self.wheel.advance(_to_tick(now))
+            try:
+                self._extend_horizon(now)
+            except Exception as e:
+                # Lo ya extraído de la rueda vuelve a ella para no perderlo
+                for post in due:
+                    self.wheel.add(post.post_id, _to_tick(post.due_at), post)
+                logger.error(f"Error al cargar publicaciones programadas: {e}")
+                raise ScheduledPostError(f"Error al cargar publicaciones: {e}") from e
+            due += self.wheel.advance(_to_tick(now))
+            if not due:
+                return []
+            self.in_flight = {post.post_id: post for post in due}
+        # La entrega se hace sin el lock para que schedule() y cancel() no esperen a dispatch
+        try:
+            dispatched = set(self.dispatch(due))
+        except Exception as e:
+            logger.error(f"Error al entregar {len(due)} publicaciones programadas: {e}")
+            dispatched = set()
+        with self._lock:
+            # Las cancelaciones y reprogramaciones hechas durante la entrega ya no están en vuelo
+            current = [post for post in due if self.in_flight.get(post.post_id) is post]
+            self.in_flight = {}
+            delivered = [post for post in current if post.post_id in dispatched]
+            failed = [post for post in current if post.post_id not in dispatched]
+            for post in failed:
+                self._retry_later(post, now)
+            if failed:
+                logger.warning(f"Publicaciones pendientes de reintento: {len(failed)}")
+            if delivered:
+                for post in delivered:
+                    self.attempts.pop(post.post_id, None)
+                self.pending_deletes.update(post.post_id for post in delivered)
+                logger.info(f"Publicaciones entregadas: {len(delivered)}")
+                self._flush_pending_deletes()
+        return delivered
+
+    def _flush_pending_deletes(self) -> None:
+        """
+        Elimina del almacenamiento las publicaciones entregadas pendientes de borrar.
+
+        Raises:
+            ScheduledPostError: Si falla el almacenamiento; los IDs siguen pendientes.
+        """
+        if not self.pending_deletes:
+            return
+        post_ids = list(self.pending_deletes)
+        try:
+            self.storage.delete_scheduled_posts(post_ids)
+        except Exception as e:
+            logger.error(f"Error al eliminar {len(post_ids)} publicaciones entregadas: {e}")
+            raise ScheduledPostError(f"Error al eliminar publicaciones entregadas: {e}") from e
+        self.pending_deletes.difference_update(post_ids)
+
+    def _retry_later(self, post: ScheduledPost, now: datetime) -> None:
+        """Vuelve a poner en la rueda una publicación no entregada con espera exponencial."""
+        attempts = self.attempts.get(post.post_id, 0) + 1
+        self.attempts[post.post_id] = attempts
+        # El exponente se acota para que timedelta no desborde tras muchos fallos
+        delay = min(self.retry_delay * 2 ** min(attempts - 1, 32), self.max_retry_delay)
+        self.wheel.add(post.post_id, _to_tick(now + delay), post)
+
+    async def run(self, interval: float = 1.0) -> None:
+        """
+        Ejecuta el planificador de forma indefinida, avanzando cada interval segundos.
+
+        Cada tick se ejecuta en el executor por defecto, de modo que un dispatch lento
+        (por ejemplo, a través de Selenium) no bloquea el bucle de eventos del bot.
+
+        Args:
+            interval (float): Segundos entre ticks.
+        """
+        loop = asyncio.get_running_loop()
+        if self.wheel is None:
+            await loop.run_in_executor(None, self.recover)
+        while True:
+            try:
+                await loop.run_in_executor(None, self.tick)
+            except Exception as e:
+                logger.error(f"Error en el ciclo del planificador: {e}")
+            await asyncio.sleep(interval)
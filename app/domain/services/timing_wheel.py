@@ -0,0 +1,125 @@
+# app/domain/services/timing_wheel.py
+"""
+Rueda de tiempo jerárquica (hierarchical timing wheel).
+
+Estructura de datos para temporizar un gran número de elementos con inserción y
+cancelación en O(1). Cada nivel divide el tiempo en ranuras de mayor granularidad; al
+avanzar, las ranuras de los niveles superiores se reparten (cascada) en los inferiores.
+"""
+
+from typing import Dict, Generic, List, Sequence, Tuple, TypeVar
+
+T = TypeVar("T")
+
+class TimingWheel(Generic[T]):
+    """
+    Rueda de tiempo jerárquica indexada por ticks enteros.
+
+    Attributes:
+        current_tick (int): Último tick procesado.
+        capacity (int): Número de ticks hacia el futuro que la rueda admite siempre.
+    """
+    def __init__(self, current_tick: int, sizes: Sequence[int] = (60, 60, 24, 8)):
+        """
+        Args:
+            current_tick (int): Tick inicial de la rueda.
+            sizes (Sequence[int]): Número de ranuras de cada nivel, del más fino al más grueso.
+        """
+        self.current_tick = current_tick
+        self._sizes = list(sizes)
+        self._spans: List[int] = []
+        span = 1
+        for size in self._sizes:
+            self._spans.append(span)
+            span *= size
+        # La ranura en curso del nivel superior no se puede reutilizar hasta la siguiente vuelta
+        self.capacity = self._spans[-1] * (self._sizes[-1] - 1)
+        self._slots: List[List[Dict[str, Tuple[int, T]]]] = [
+            [{} for _ in range(size)] for size in self._sizes
+        ]
+        self._expired: Dict[str, Tuple[int, T]] = {}
+        self._index: Dict[str, Dict[str, Tuple[int, T]]] = {}
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._index
+
+    def _bucket(self, tick: int) -> Dict[str, Tuple[int, T]]:
+        """Devuelve la ranura que corresponde a un tick respecto a current_tick."""
+        if tick <= self.current_tick:
+            return self._expired
+        for level, (span, size) in enumerate(zip(self._spans, self._sizes)):
+            level_start = self.current_tick - self.current_tick % span
+            if tick < level_start + span * size:
+                return self._slots[level][(tick // span) % size]
+        raise ValueError(f"El tick {tick} supera la capacidad de la rueda ({self.capacity} ticks).")
+
+    def add(self, key: str, tick: int, item: T) -> None:
+        """
+        Inserta un elemento que vence en el tick indicado, sustituyendo al anterior con la misma clave.
+
+        Raises:
+            ValueError: Si el tick queda fuera de la capacidad de la rueda.
+        """
+        bucket = self._bucket(tick)
+        self.cancel(key)
+        bucket[key] = (tick, item)
+        self._index[key] = bucket
+
+    def cancel(self, key: str) -> bool:
+        """
+        Cancela un elemento pendiente.
+
+        Returns:
+            bool: True si el elemento estaba en la rueda.
+        """
+        bucket = self._index.pop(key, None)
+        if bucket is None:
+            return False
+        del bucket[key]
+        return True
+
+    def advance(self, tick: int) -> List[T]:
+        """
+        Avanza la rueda hasta el tick indicado y devuelve los elementos vencidos.
+
+        Args:
+            tick (int): Tick actual.
+
+        Returns:
+            List[T]: Elementos cuyo tick es menor o igual que el indicado.
+        """
+        if not self._index:
+            self.current_tick = max(self.current_tick, tick)
+            return []
+        while self.current_tick < tick and len(self._expired) < len(self._index):
+            self.current_tick += 1
+            now = self.current_tick
+            # Cascada de los niveles superiores, del más grueso al más fino
+            for level in range(len(self._sizes) - 1, 0, -1):
+                span = self._spans[level]
+                if now % span:
+                    continue
+                bucket = self._slots[level][(now // span) % self._sizes[level]]
+                if not bucket:
+                    continue
+                entries = list(bucket.items())
+                bucket.clear()
+                for key, (due, item) in entries:
+                    target = self._bucket(due)
+                    target[key] = (due, item)
+                    self._index[key] = target
+            bucket = self._slots[0][now % self._sizes[0]]
+            if bucket:
+                for key, entry in bucket.items():
+                    self._expired[key] = entry
+                    self._index[key] = self._expired
+                bucket.clear()
+        self.current_tick = max(self.current_tick, tick)
+        expired = [item for _, item in self._expired.values()]
+        for key in self._expired:
+            del self._index[key]
+        self._expired.clear()
+        return expired
@@ -5,7 +5,9 @@ Define la interfaz para guardar y recuperar datos.
 """
 
 from abc import ABC, abstractmethod
-from typing import Optional
+from datetime import datetime
+from typing import List, Optional
+from app.domain.entities.scheduled_post import ScheduledPost
 from app.domain.entities.session import Session
 
 class StoragePort(ABC):
@@ -43,4 +45,38 @@ class StoragePort(ABC):
         Args:
             session_id (str): ID de la sesión a eliminar.
         """
+        pass
+
+    @abstractmethod
+    def save_scheduled_post(self, post: ScheduledPost) -> None:
+        """
+        Guarda una publicación programada, sustituyendo la anterior con el mismo ID.
+
+        Args:
+            post (ScheduledPost): Publicación a guardar.
+        """
+        pass
+
+    @abstractmethod
+    def load_scheduled_posts(self, start: Optional[datetime], end: datetime) -> List[ScheduledPost]:
+        """
+        Carga las publicaciones pendientes cuya fecha está en el intervalo [start, end).
+
+        Args:
+            start (Optional[datetime]): Inicio del intervalo; None para incluir todas las atrasadas.
+            end (datetime): Fin (exclusivo) del intervalo.
+
+        Returns:
+            List[ScheduledPost]: Publicaciones pendientes del intervalo.
+        """
+        pass
+
+    @abstractmethod
+    def delete_scheduled_posts(self, post_ids: List[str]) -> None:
+        """
+        Elimina un lote de publicaciones programadas.
+
+        Args:
+            post_ids (List[str]): IDs de las publicaciones a eliminar.
+        """
         pass
\ No newline at end of file